@@ -5,10 +5,11 @@ from aqt.qt import *
 from aqt.utils import showInfo
 from aqt import gui_hooks
 from aqt.webview import AnkiWebView
+from aqt.reviewer import Reviewer
 
-import copy
 import json
 import re
+from functools import lru_cache
 
 
 ADDON_NAME = __name__  # this add-on folder name
@@ -16,26 +17,28 @@ ADDON_NAME = __name__  # this add-on folder name
 
 # ========= Shipped defaults =========
 
-DEFAULT_CONF: dict = {
-    "enabled": True,
-    "languages": [
-        "en-US",
-        "ja-JP",
-    ],
-    "voices": {
-        "en-US": [
-            "",
-            "Microsoft David",
-            "Microsoft Zira",
+def _make_default_conf() -> dict:
+    """Return a fresh copy of the shipped defaults (no shared references)."""
+    return {
+        "enabled": True,
+        "languages": [
+            "en-US",
+            "ja-JP",
         ],
-        "ja-JP": [
-            "",
-            "Microsoft Haruka",
-            "Microsoft Sayaka",
-        ],
-    },
-    "fieldSettings": {},
-}
+        "voices": {
+            "en-US": [
+                "",
+                "Microsoft David",
+                "Microsoft Zira",
+            ],
+            "ja-JP": [
+                "",
+                "Microsoft Haruka",
+                "Microsoft Sayaka",
+            ],
+        },
+        "fieldSettings": {},
+    }
 
 
 # ========= Utilities =========
@@ -44,7 +47,7 @@ def get_conf() -> dict:
     """Return current config; if none, write shipped defaults first."""
     conf = mw.addonManager.getConfig(ADDON_NAME)
     if conf is None:
-        conf = copy.deepcopy(DEFAULT_CONF)
+        conf = _make_default_conf()
         mw.addonManager.writeConfig(ADDON_NAME, conf)
     return conf
 
@@ -55,22 +58,35 @@ def write_conf(conf: dict) -> None:
 
 def reset_conf_to_defaults() -> dict:
     """Overwrite config with shipped defaults and return the new config."""
-    conf = copy.deepcopy(DEFAULT_CONF)
+    conf = _make_default_conf()
     write_conf(conf)
     return conf
 
 
+_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#39;",
+})
+_ESCAPE_RE = re.compile(r"[&<>\"']")
+
+
 def escape_attr(s: str) -> str:
     """Escape for HTML attributes."""
     if s is None:
         return ""
-    return (
-        s.replace("&", "&amp;")
-         .replace("<", "&lt;")
-         .replace(">", "&gt;")
-         .replace('"', "&quot;")
-         .replace("'", "&#39;")
-    )
+    # Most values (lang codes, voice names) need no escaping at all
+    if not _ESCAPE_RE.search(s):
+        return s
+    return s.translate(_ESCAPE_TABLE)
+
+
+@lru_cache(maxsize=1024)
+def escape_attr_small(s: str) -> str:
+    """Cached escape_attr for short, frequently repeated values (lang/voice/field names)."""
+    return escape_attr(s)
 
 
 # ========= Initialize fieldSettings =========
@@ -82,6 +98,7 @@ def ensure_field_settings() -> None:
     """
     conf = get_conf()
     field_settings = conf.get("fieldSettings", {})
+    dirty = "fieldSettings" not in conf
 
     col = mw.col
     if not col:
@@ -91,6 +108,7 @@ def ensure_field_settings() -> None:
         mid = str(model["id"])
         if mid not in field_settings:
             field_settings[mid] = {}
+            dirty = True
 
         mconf = field_settings[mid]
         for fld in model["flds"]:
@@ -101,13 +119,190 @@ def ensure_field_settings() -> None:
                     "lang": "ja-JP",
                     "voice": "",
                 }
+                dirty = True
 
-    conf["fieldSettings"] = field_settings
-    write_conf(conf)
+    # Only touch the add-on store when an entry was actually added
+    if dirty:
+        conf["fieldSettings"] = field_settings
+        write_conf(conf)
 
 
 # ========= Config Dialog =========
 
+class FieldSettingsModel(QAbstractTableModel):
+    """
+    In-memory rows of [field name, enabled, lang, voice] for one note type.
+    Editors are provided on demand by the delegates below.
+    """
+
+    HEADERS = ["Fields", "Enabled", "Languages", "Voices"]
+
+    def __init__(self, dialog: "TtsConfigDialog"):
+        super().__init__(dialog)
+        self.dialog = dialog
+        self._rows: list[list] = []
+
+    def setRows(self, rows: list[list]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rows(self) -> list[list]:
+        return self._rows
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+            and 0 <= section < len(self.HEADERS)
+        ):
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        col = index.column()
+
+        if col == 1:
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return Qt.CheckState.Checked if row[1] else Qt.CheckState.Unchecked
+            return None
+
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return row[col]
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.ItemDataRole.EditRole) -> bool:
+        if not index.isValid():
+            return False
+        row = self._rows[index.row()]
+        col = index.column()
+
+        if col == 1 and role == Qt.ItemDataRole.CheckStateRole:
+            row[1] = Qt.CheckState(value) == Qt.CheckState.Checked
+            self.dataChanged.emit(index, index, [role])
+            return True
+
+        if col == 2 and role == Qt.ItemDataRole.EditRole:
+            if value == row[2]:
+                return False
+            row[2] = value
+            # Language changed: fall back to the first voice for it
+            row[3] = self.dialog.voices_for_lang(value)[0]
+            self.dataChanged.emit(index, index.sibling(index.row(), 3), [role])
+            return True
+
+        if col == 3 and role == Qt.ItemDataRole.EditRole:
+            row[3] = value
+            self.dataChanged.emit(index, index, [role])
+            return True
+
+        return False
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        col = index.column()
+        if col == 0:
+            return Qt.ItemFlag.ItemIsEnabled
+        if col == 1:
+            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEditable
+
+
+class _CenteredCheckDelegate(QStyledItemDelegate):
+    """Draws and toggles the Enabled check box in the middle of its cell."""
+
+    def _check_rect(self, option) -> QRect:
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+        size = style.subElementRect(
+            QStyle.SubElement.SE_CheckBoxIndicator, QStyleOptionButton(), widget
+        ).size()
+        return QStyle.alignedRect(
+            option.direction, Qt.AlignmentFlag.AlignCenter, size, option.rect
+        )
+
+    def paint(self, painter, option, index: QModelIndex) -> None:
+        widget = option.widget
+        style = widget.style() if widget else QApplication.style()
+
+        # Background / selection only; the indicator is drawn centred below
+        opt = QStyleOptionViewItem(option)
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, opt, painter, widget)
+
+        checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+        btn = QStyleOptionButton()
+        btn.rect = self._check_rect(option)
+        btn.state = QStyle.StateFlag.State_Enabled | (
+            QStyle.StateFlag.State_On if checked else QStyle.StateFlag.State_Off
+        )
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_IndicatorItemViewItemCheck, btn, painter, widget)
+
+    def editorEvent(self, event, model, option, index: QModelIndex) -> bool:
+        flags = index.flags()
+        if not (flags & Qt.ItemFlag.ItemIsUserCheckable and flags & Qt.ItemFlag.ItemIsEnabled):
+            return False
+
+        etype = event.type()
+        if etype in (
+            QEvent.Type.MouseButtonPress,
+            QEvent.Type.MouseButtonRelease,
+            QEvent.Type.MouseButtonDblClick,
+        ):
+            if event.button() != Qt.MouseButton.LeftButton:
+                return False
+            if not self._check_rect(option).contains(event.position().toPoint()):
+                return False
+            # Toggle on release; swallow press/double-click so they don't toggle twice
+            if etype != QEvent.Type.MouseButtonRelease:
+                return True
+        elif etype == QEvent.Type.KeyPress:
+            if event.key() not in (Qt.Key.Key_Space, Qt.Key.Key_Select):
+                return False
+        else:
+            return False
+
+        checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+        new_state = Qt.CheckState.Unchecked if checked else Qt.CheckState.Checked
+        return model.setData(index, new_state, Qt.ItemDataRole.CheckStateRole)
+
+
+class _ComboDelegate(QStyledItemDelegate):
+    """Shows plain text; builds a QComboBox only while a cell is being edited."""
+
+    def __init__(self, dialog: "TtsConfigDialog", list_model_for):
+        super().__init__(dialog)
+        # index -> QStringListModel to show in the dropdown
+        self.list_model_for = list_model_for
+
+    def createEditor(self, parent: QWidget, option, index: QModelIndex) -> QWidget:
+        combo = QComboBox(parent)
+        combo.setModel(self.list_model_for(index))
+        combo.activated.connect(lambda _idx, c=combo: self._commit_and_close(c))
+        # Editors only open on an explicit click/F2, so show the list straight away
+        QTimer.singleShot(0, combo.showPopup)
+        return combo
+
+    def setEditorData(self, editor: QWidget, index: QModelIndex) -> None:
+        editor.setCurrentText(index.data(Qt.ItemDataRole.EditRole) or "")
+
+    def setModelData(self, editor: QWidget, model, index: QModelIndex) -> None:
+        model.setData(index, editor.currentText(), Qt.ItemDataRole.EditRole)
+
+    def _commit_and_close(self, editor: QWidget) -> None:
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor)
+
+
 class TtsConfigDialog(QDialog):
     """
     Note type × field settings:
@@ -141,6 +336,11 @@ class TtsConfigDialog(QDialog):
             self.lang_list = self.conf.get("languages", ["en-US", "ja-JP"])
             self.voice_map = self.conf.get("voices", {})
 
+        # Combo models shared by every row's editor; voice models are built
+        # per language the first time an editor needs one
+        self.lang_model = QStringListModel(self.lang_list, self)
+        self.voice_models: dict[str, QStringListModel] = {}
+
         self.col = mw.col
         self.models_by_id: dict[str, dict] = {}
         self.model_ids: list[str] = []
@@ -175,9 +375,26 @@ class TtsConfigDialog(QDialog):
         main_layout.addLayout(top_layout)
 
         # Fields table
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["Fields", "Enabled", "Languages", "Voices"])
+        self.fields_model = FieldSettingsModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.fields_model)
+        self.table.setItemDelegateForColumn(1, _CenteredCheckDelegate(self))
+        self.table.setItemDelegateForColumn(2, _ComboDelegate(
+            self, lambda index: self.lang_model,
+        ))
+        self.table.setItemDelegateForColumn(3, _ComboDelegate(
+            self,
+            lambda index: self.voice_model_for_lang(
+                index.sibling(index.row(), 2).data(Qt.ItemDataRole.EditRole) or ""
+            ),
+        ))
+        # Only explicit triggers: tabbing/arrowing through the table must not pop up editors
+        self.table.setEditTriggers(
+            QAbstractItemView.EditTrigger.DoubleClicked
+            | QAbstractItemView.EditTrigger.EditKeyPressed
+        )
+        # A single click on a language/voice cell opens its dropdown, like the old cell combos
+        self.table.clicked.connect(self._on_table_clicked)
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
@@ -222,62 +439,45 @@ class TtsConfigDialog(QDialog):
             return
 
         mconf = self.field_settings.get(mid, {})
-        flds = model["flds"]
-
-        self.table.setRowCount(len(flds))
+        default_lang = self.lang_list[0] if self.lang_list else ""
 
-        for row, fld in enumerate(flds):
+        rows: list[list] = []
+        for fld in model["flds"]:
             fname = fld["name"]
-
-            # (1) Field name (read-only)
-            item_name = QTableWidgetItem(fname)
-            item_name.setFlags(Qt.ItemFlag.ItemIsEnabled)
-            self.table.setItem(row, 0, item_name)
-
             fconf = mconf.get(fname, {})
 
-            # (2) Enabled checkbox
-            chk = QCheckBox()
-            chk.setChecked(bool(fconf.get("enabled", False)))
-            cell_widget_chk = QWidget()
-            lay_chk = QHBoxLayout(cell_widget_chk)
-            lay_chk.setContentsMargins(0, 0, 0, 0)
-            lay_chk.addWidget(chk, alignment=Qt.AlignmentFlag.AlignCenter)
-            self.table.setCellWidget(row, 1, cell_widget_chk)
-
-            # (3) Language combo
-            combo_lang = QComboBox()
-            for lang in self.lang_list:
-                combo_lang.addItem(lang)
-            cur_lang = fconf.get("lang", self.lang_list[0] if self.lang_list else "")
-            if cur_lang in self.lang_list:
-                combo_lang.setCurrentText(cur_lang)
-
-            # (4) Voice combo
-            combo_voice = QComboBox()
+            cur_lang = fconf.get("lang", default_lang)
+            if cur_lang not in self.lang_list:
+                cur_lang = default_lang
+
+            voices = self.voices_for_lang(cur_lang)
             cur_voice = fconf.get("voice", "")
-            self._update_voice_combo(combo_voice, cur_lang, cur_voice)
+            if cur_voice not in voices:
+                cur_voice = voices[0]
 
-            # Update voice list when language changes
-            def on_lang_changed(new_lang, vc=combo_voice):
-                self._update_voice_combo(vc, new_lang, None)
+            rows.append([fname, bool(fconf.get("enabled", False)), cur_lang, cur_voice])
 
-            combo_lang.currentTextChanged.connect(on_lang_changed)
+        self.fields_model.setRows(rows)
 
-            self.table.setCellWidget(row, 2, combo_lang)
-            self.table.setCellWidget(row, 3, combo_voice)
+    def _on_table_clicked(self, index: QModelIndex) -> None:
+        if index.column() in (2, 3):
+            self.table.edit(index)
 
-    def _update_voice_combo(self, combo: QComboBox, lang: str, selected: str | None) -> None:
-        combo.clear()
-        voices_for_lang = self.voice_map.get(lang, [])
-        if not voices_for_lang:
-            voices_for_lang = [""]
+    def voices_for_lang(self, lang: str) -> list[str]:
+        return self.voice_map.get(lang) or [""]
 
-        for v in voices_for_lang:
-            combo.addItem(v)
+    def _refresh_list_models(self) -> None:
+        """Reload the shared combo models in place after lang_list/voice_map change."""
+        self.lang_model.setStringList(self.lang_list)
+        for lang, model in self.voice_models.items():
+            model.setStringList(self.voices_for_lang(lang))
 
-        if selected and selected in voices_for_lang:
-            combo.setCurrentText(selected)
+    def voice_model_for_lang(self, lang: str) -> QStringListModel:
+        model = self.voice_models.get(lang)
+        if model is None:
+            model = QStringListModel(self.voices_for_lang(lang), self)
+            self.voice_models[lang] = model
+        return model
 
     # ---- Save / Reset ----
 
@@ -294,49 +494,17 @@ class TtsConfigDialog(QDialog):
         self.conf["fieldSettings"] = self.field_settings
         write_conf(self.conf)
 
-        # Re-ensure structure
-        ensure_field_settings()
-
         super().accept()
 
     def _save_current_model_settings(self, mid: str) -> None:
-        model = self.models_by_id.get(mid)
-        if not model:
+        if mid not in self.models_by_id:
             return
 
-        flds = model["flds"]
-        rows = self.table.rowCount()
-        if rows != len(flds):
-            rows = min(rows, len(flds))
-
-        mconf = self.field_settings.get(mid, {})
+        mconf = self.field_settings.get(mid)
         if mconf is None:
             mconf = {}
-            self.field_settings[mid] = mconf
-
-        for row in range(rows):
-            fname = flds[row]["name"]
-
-            # enabled
-            enabled = False
-            cell_chk = self.table.cellWidget(row, 1)
-            if cell_chk:
-                chk = cell_chk.findChild(QCheckBox)
-                if chk:
-                    enabled = chk.isChecked()
-
-            # lang
-            lang_val = ""
-            combo_lang = self.table.cellWidget(row, 2)
-            if isinstance(combo_lang, QComboBox):
-                lang_val = combo_lang.currentText()
-
-            # voice
-            voice_val = ""
-            combo_voice = self.table.cellWidget(row, 3)
-            if isinstance(combo_voice, QComboBox):
-                voice_val = combo_voice.currentText()
 
+        for fname, enabled, lang_val, voice_val in self.fields_model.rows():
             mconf[fname] = {
                 "enabled": enabled,
                 "lang": lang_val,
@@ -346,7 +514,7 @@ class TtsConfigDialog(QDialog):
         self.field_settings[mid] = mconf
 
     def on_reset_defaults(self) -> None:
-        # Save pending edits (table widgets are not auto-synced)
+        # Save pending edits (the table model is not written back until saved)
         mid = self.model_combo.currentData()
         if mid:
             self._save_current_model_settings(mid)
@@ -376,6 +544,7 @@ class TtsConfigDialog(QDialog):
         else:
             self.lang_list = self.conf.get("languages", ["en-US", "ja-JP"])
             self.voice_map = self.conf.get("voices", {})
+        self._refresh_list_models()
 
         self.enabled_chk.setChecked(bool(self.conf.get("enabled", True)))
 
@@ -451,6 +620,7 @@ class TtsConfigDialog(QDialog):
         # Update dialog lists
         self.lang_list = self.conf["languages_auto"]
         self.voice_map = self.conf["voices_auto"]
+        self._refresh_list_models()
 
         # Refresh current table
         idx = self.model_combo.currentIndex()
@@ -485,9 +655,12 @@ class TtsConfigDialog(QDialog):
 
 # ========= Browser-side JS =========
 
+# Loaded once into the page head; cards only carry _TTS_AUTOPLAY_JS.
 TTS_JS = r'''
 <script>
 (function() {
+    if (window._ttsAutoHelperInitialized) return;
+    window._ttsAutoHelperInitialized = true;
 
     function speak(text, lang, voiceName, onDone) {
         if (!("speechSynthesis" in window)) {
@@ -531,17 +704,14 @@ TTS_JS = r'''
     }
 
     // Manual click play
-    if (!window._ttsAutoHelperInitialized) {
-        window._ttsAutoHelperInitialized = true;
-        document.addEventListener("click", function(ev) {
-            var btn = ev.target.closest(".tts-auto-helper-btn");
-            if (!btn) return;
-            var text = btn.getAttribute("data-tts-text") || "";
-            var lang = btn.getAttribute("data-tts-lang") || "";
-            var voice = btn.getAttribute("data-tts-voice") || "";
-            speak(text, lang, voice, null);
-        });
-    }
+    document.addEventListener("click", function(ev) {
+        var btn = ev.target.closest(".tts-auto-helper-btn");
+        if (!btn) return;
+        var text = btn.getAttribute("data-tts-text") || "";
+        var lang = btn.getAttribute("data-tts-lang") || "";
+        var voice = btn.getAttribute("data-tts-voice") || "";
+        speak(text, lang, voice, null);
+    });
 
     // Auto play all enabled buttons sequentially
     function autoPlayAllButtons() {
@@ -563,17 +733,25 @@ TTS_JS = r'''
         playNext();
     }
 
-    if (document.readyState === "complete" || document.readyState === "interactive") {
+    // Called by each rendered card side (see _TTS_AUTOPLAY_JS)
+    window._ttsAutoHelperAutoPlay = function() {
         setTimeout(autoPlayAllButtons, 10);
-    } else {
-        document.addEventListener("DOMContentLoaded", function() {
-            setTimeout(autoPlayAllButtons, 10);
-        });
-    }
+    };
 })();
 </script>
 '''
 
+_TTS_AUTOPLAY_JS = (
+    "<script>"
+    "if (window._ttsAutoHelperAutoPlay) { window._ttsAutoHelperAutoPlay(); }"
+    "</script>"
+)
+
+
+def on_webview_will_set_content(web_content, context) -> None:
+    if isinstance(context, Reviewer):
+        web_content.head += TTS_JS
+
 
 
 # ========= Voice probing (run once per profile) =========
@@ -668,7 +846,43 @@ def _start_voice_probe() -> None:
 
 # ========= Card hook =========
 
+_SUPPORTED_KINDS = frozenset(("reviewQuestion", "reviewAnswer"))
+
+_FIELD_RE = re.compile(r"\{\{([^}]+)\}\}")
+# Exact id="answer" wins over a bare id=answer, as before; "answer-wrap" etc. never match
+_ANSWER_ID_RE = re.compile(r'id\s*=\s*"answer"')
+_ANSWER_ID_BARE_RE = re.compile(r'id\s*=\s*answer(?=[\s>/]|$)')
+
+
+def _answer_search_part(afmt: str) -> str:
+    """Return the part of the answer template from id="answer" onwards."""
+    m = _ANSWER_ID_RE.search(afmt) or _ANSWER_ID_BARE_RE.search(afmt)
+    return afmt[m.start():] if m else afmt
+
+
+_BTN_TMPL = (
+    '<button class="tts-auto-helper-btn" '
+    'data-tts-text="{t}" '
+    'data-tts-lang="{l}" '
+    'data-tts-voice="{v}" '
+    'style="margin: 2px; padding: 2px 6px; font-size: 12px;">'
+    '🔊 {n}'
+    '</button>'
+)
+
+# (mid, card ord, kind, model mod) -> field names referenced on that side
+_TEMPLATE_FIELDS_CACHE: dict[tuple, list[str]] = {}
+_TEMPLATE_FIELDS_CACHE_MAX = 4096
+
+# model id -> (mid str, field names, field name set, tmpls, model mod)
+_MODEL_META_CACHE: dict[int, tuple[str, list[str], set[str], list, int]] = {}
+
+
 def inject_tts_buttons(html_text: str, card, kind: str) -> str:
+    # Previews / card layout interpolate fields differently; leave them alone
+    if kind not in _SUPPORTED_KINDS:
+        return html_text
+
     conf = get_conf()
     if not conf.get("enabled", True):
         return html_text
@@ -679,42 +893,57 @@ def inject_tts_buttons(html_text: str, card, kind: str) -> str:
 
     note = card.note()
     model = note.note_type()
-    mid = str(model["id"])
+
+    mod = model.get("mod", 0)
+    model_id = model["id"]
+    meta = _MODEL_META_CACHE.get(model_id)
+    if meta is None or meta[4] != mod:
+        names = [fld["name"] for fld in model["flds"]]
+        meta = (str(model_id), names, set(names), model.get("tmpls", []), mod)
+        _MODEL_META_CACHE[model_id] = meta
+    # Everything below goes through the cached meta, not the model dict
+    mid, field_names, field_names_set, tmpls, _ = meta
 
     field_settings = conf.get("fieldSettings", {})
     model_conf = field_settings.get(mid)
     if not model_conf:
         return html_text
+    if not any(fc.get("enabled") for fc in model_conf.values()):
+        return html_text
 
-    model_fields = model["flds"]
-    field_names = [fld["name"] for fld in model_fields]
+    key = (mid, card.ord, kind, mod)
+    target_field_names = _TEMPLATE_FIELDS_CACHE.get(key)
+    if target_field_names is None:
+        target_field_names = []
+        seen: set[str] = set()
+        try:
+            tmpl = tmpls[card.ord] if card.ord < len(tmpls) else tmpls[0]
 
-    target_field_names: list[str] = []
-    try:
-        tmpls = model["tmpls"]
-        tmpl = tmpls[card.ord] if card.ord < len(tmpls) else tmpls[0]
-
-        if kind == "reviewAnswer":
-            afmt = tmpl.get("afmt", "")
-            idx = afmt.find('id="answer"')
-            if idx == -1:
-                idx = afmt.find("id=answer")
-            search_part = afmt[idx:] if idx != -1 else afmt
-        else:
-            search_part = tmpl.get("qfmt", "")
+            if kind == "reviewAnswer":
+                search_part = _answer_search_part(tmpl.get("afmt", ""))
+            else:
+                search_part = tmpl.get("qfmt", "")
 
-        for m in re.finditer(r"{{([^}]+)}}", search_part):
-            name = m.group(1).strip()
-            if name in field_names and name not in target_field_names:
-                target_field_names.append(name)
+            for m in _FIELD_RE.finditer(search_part):
+                name = m.group(1).strip()
+                if name in field_names_set and name not in seen:
+                    seen.add(name)
+                    target_field_names.append(name)
 
-    except Exception:
-        target_field_names = []
+        except Exception:
+            target_field_names = []
 
-    if not target_field_names:
-        target_field_names = field_names[:]
+        if not target_field_names:
+            target_field_names = field_names[:]
+
+        # Editing a note type bumps its "mod", so stale entries are never hit
+        if len(_TEMPLATE_FIELDS_CACHE) >= _TEMPLATE_FIELDS_CACHE_MAX:
+            _TEMPLATE_FIELDS_CACHE.clear()
+        _TEMPLATE_FIELDS_CACHE[key] = target_field_names
 
     blocks: list[str] = []
+    # Most fields share a handful of (lang, voice) pairs
+    esc_cache: dict[tuple[str, str], tuple[str, str]] = {}
 
     for fname in target_field_names:
         fconf = model_conf.get(fname)
@@ -729,19 +958,18 @@ def inject_tts_buttons(html_text: str, card, kind: str) -> str:
         if not text:
             continue
 
-        lang = fconf.get("lang", "")
-        voice = fconf.get("voice", "")
-
-        btn_html = (
-            '<button class="tts-auto-helper-btn" '
-            f'data-tts-text="{escape_attr(text)}" '
-            f'data-tts-lang="{escape_attr(lang)}" '
-            f'data-tts-voice="{escape_attr(voice)}" '
-            'style="margin: 2px; padding: 2px 6px; font-size: 12px;">'
-            '🔊 ' + escape_attr(fname) +
-            '</button>'
-        )
-        blocks.append(btn_html)
+        lang_voice = (fconf.get("lang", ""), fconf.get("voice", ""))
+        esc = esc_cache.get(lang_voice)
+        if esc is None:
+            esc = (escape_attr_small(lang_voice[0]), escape_attr_small(lang_voice[1]))
+            esc_cache[lang_voice] = esc
+
+        blocks.append(_BTN_TMPL.format(
+            t=escape_attr(text),
+            l=esc[0],
+            v=esc[1],
+            n=escape_attr_small(fname),
+        ))
 
     if not blocks:
         return html_text
@@ -753,11 +981,7 @@ def inject_tts_buttons(html_text: str, card, kind: str) -> str:
         "</div>"
     )
 
-    if "_ttsAutoHelperInitialized" not in html_text:
-        html_text += TTS_JS
-
-    html_text += container
-    return html_text
+    return "".join((html_text, container, _TTS_AUTOPLAY_JS))
 
 
 # ========= Entry points =========
@@ -791,6 +1015,7 @@ def on_profile_loaded() -> None:
     # Avoid duplicate hook registration on some reload patterns
     if not _TTS_AUTO_HELPER_INITIALIZED:
         gui_hooks.card_will_show.append(inject_tts_buttons)
+        gui_hooks.webview_will_set_content.append(on_webview_will_set_content)
         _TTS_AUTO_HELPER_INITIALIZED = True
 
 
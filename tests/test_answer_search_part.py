@@ -0,0 +1,50 @@
+import ast
+import pathlib
+import re
+import unittest
+
+# The add-on imports aqt at module level, so pull just the pure helper out of the source.
+_SRC = pathlib.Path(__file__).resolve().parent.parent / "__init__.py"
+_NAMES = {"_ANSWER_ID_RE", "_ANSWER_ID_BARE_RE", "_answer_search_part"}
+
+
+def _load_helper():
+    tree = ast.parse(_SRC.read_text(encoding="utf-8"))
+    body = []
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name in _NAMES:
+            body.append(node)
+        elif isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id in _NAMES for t in node.targets
+        ):
+            body.append(node)
+    ns = {"re": re}
+    exec(compile(ast.Module(body=body, type_ignores=[]), str(_SRC), "exec"), ns)
+    return ns["_answer_search_part"]
+
+
+_answer_search_part = _load_helper()
+
+
+class AnswerSearchPartTest(unittest.TestCase):
+    def test_hyphenated_id_is_not_answer(self):
+        afmt = 'x<div id="answer-wrap">{{Front}}</div><hr id=answer>{{Back}}'
+        self.assertEqual(_answer_search_part(afmt), "id=answer>{{Back}}")
+
+    def test_bare_id(self):
+        self.assertEqual(_answer_search_part("{{Front}}<hr id=answer>{{Back}}"), "id=answer>{{Back}}")
+
+    def test_bare_id_at_end_of_template(self):
+        self.assertEqual(_answer_search_part("{{Front}}<hr id=answer"), "id=answer")
+
+    def test_quoted_id_preferred_over_bare(self):
+        afmt = '<hr id=answer>{{Front}}<div id="answer">{{Back}}</div>'
+        self.assertEqual(_answer_search_part(afmt), 'id="answer">{{Back}}</div>')
+
+    def test_no_answer_id(self):
+        afmt = '<div id="answer-box">{{Back}}</div>'
+        self.assertEqual(_answer_search_part(afmt), afmt)
+
+
+if __name__ == "__main__":
+    unittest.main()